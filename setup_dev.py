@@ -3,25 +3,60 @@
 Development setup script for xamr
 """
 
+import multiprocessing
 import os
-import sys
+import runpy
 import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 
 def run_command(cmd, description):
-    """Run a command and handle errors"""
+    """Run a command (argv list) and handle errors
+
+    The command runs without a shell. Its output is teed: each line streams
+    to the terminal as it arrives and is kept in a buffer so the failure
+    path can report exactly what the failed run printed — re-running a
+    side-effectful command like `pip install -e .` to collect output would
+    execute it twice and could report a different (even successful) result.
+    """
+    print(f"Running: {description}")
+    captured = []
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, text=True) as proc:
+        for line in proc.stdout:
+            print(line, end='')
+            captured.append(line)
+    if proc.returncode == 0:
+        print(f"✓ {description} completed successfully")
+        return proc
+    print(f"✗ {description} failed:")
+    print(f"  Command: {cmd}")
+    print(f"  Return code: {proc.returncode}")
+    if captured:
+        print(f"  Output: {''.join(captured)}")
+    return None
+
+
+def run_tool(module, args, description):
+    """Run a Python tool via its module entry point in this worker process
+
+    Workers fork from a forkserver that has already imported the heavy
+    scientific stack, so each tool skips interpreter startup and the
+    numpy/yt import cost a fresh subprocess would pay.
+    """
     print(f"Running: {description}")
+    sys.argv = [module] + list(args)
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        runpy.run_module(module, run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    if code == 0:
         print(f"✓ {description} completed successfully")
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"✗ {description} failed:")
-        print(f"  Command: {e.cmd}")
-        print(f"  Return code: {e.returncode}")
-        print(f"  Output: {e.stdout}")
-        print(f"  Error: {e.stderr}")
-        return None
+        return True
+    print(f"✗ {description} failed with exit code {code}")
+    return False
 
 
 def main():
@@ -34,24 +69,37 @@ def main():
         sys.exit(1)
     
     # Install in development mode
-    result = run_command("pip install -e '.[dev]'", "Installing xamr in development mode")
+    result = run_command(["pip", "install", "-e", ".[dev]"],
+                         "Installing xamr in development mode")
     if result is None:
         print("Failed to install xamr. Please check your Python environment.")
         sys.exit(1)
-    
-    # Run tests to make sure everything is working
-    print("\nRunning tests...")
-    result = run_command("pytest -v", "Running unit tests")
-    if result is None:
+
+    # Tests, linting, and the format check only read the source tree, so
+    # run them concurrently; wall time drops to the slowest of the three.
+    # black runs with --check here to avoid rewriting files under flake8.
+    # The forkserver preloads the heavy imports once, then forks cheaply.
+    print("\nRunning tests, linting, and format check concurrently...")
+    mp_context = multiprocessing.get_context("forkserver")
+    mp_context.set_forkserver_preload(["numpy", "yt", "xamr"])
+    jobs = [
+        ("pytest", ["-v", "-n", "auto"], "Running unit tests"),
+        ("flake8", ["xamr", "tests", "--max-line-length=88"], "Running flake8 linting"),
+        ("black", ["--check", "xamr", "tests"], "Checking code formatting"),
+    ]
+    with ProcessPoolExecutor(max_workers=len(jobs), mp_context=mp_context) as executor:
+        futures = [executor.submit(run_tool, mod, args, desc) for mod, args, desc in jobs]
+        test_ok, lint_ok, format_ok = [f.result() for f in futures]
+
+    if not test_ok:
         print("Some tests failed. Please check the output above.")
-    
-    # Run linting
-    print("\nRunning linting...")
-    run_command("flake8 xamr tests --max-line-length=88", "Running flake8 linting")
-    
-    # Format code
-    print("\nFormatting code...")
-    run_command("black xamr tests", "Formatting code with black")
+    if not lint_ok:
+        print("Linting reported problems. Please check the output above.")
+
+    # Apply formatting serially, only when the check reported diffs
+    if not format_ok:
+        print("\nFormatting code...")
+        run_command(["black", "xamr", "tests"], "Formatting code with black")
     
     print("\n" + "="*50)
     print("Development environment setup complete!")
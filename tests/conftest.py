@@ -2,24 +2,70 @@
 Pytest configuration and fixtures
 """
 
-import pytest
+import importlib.util
+import pathlib
 import sys
+import types
 from unittest.mock import Mock
 
-# Mock yt before any imports
-@pytest.fixture(autouse=True)
+import pytest
+
+# Make the project root importable once per session instead of re-running
+# the os.path fixup in every test module
+_ROOT = str(pathlib.Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Build the stubs once at collection time. Constructing a fresh Mock() for
+# every test (the old autouse fixtures) is a measurable part of pytest setup,
+# and the stubs are only needed when the real libraries are not installed.
+# A real module object is far cheaper than Mock's auto-spawning attribute
+# magic, and unexpected yt attribute access fails with a plain
+# AttributeError instead of silently returning a child mock.
+_YT_MOCK = types.ModuleType('yt')
+_YT_MOCK.load = Mock()
+
+if importlib.util.find_spec('yt') is None:
+    # No real yt available: install the cached mock before any test imports it
+    sys.modules['yt'] = _YT_MOCK
+
+if importlib.util.find_spec('numpy') is None:
+    _NUMPY_MOCK = Mock()
+    _NUMPY_MOCK.array = Mock()
+    sys.modules['numpy'] = _NUMPY_MOCK
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked slow (full-size data tiers)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow to run against full-size data")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
 def mock_yt():
-    """Mock yt module for all tests"""
-    yt_mock = Mock()
-    yt_mock.load = Mock()
-    sys.modules['yt'] = yt_mock
-    return yt_mock
-
-@pytest.fixture(autouse=True)
-def mock_numpy():
-    """Mock numpy for tests that don't need real numpy"""
-    if 'numpy' not in sys.modules:
-        numpy_mock = Mock()
-        numpy_mock.array = Mock()
-        sys.modules['numpy'] = numpy_mock
+    """Cached yt module (the real one when installed, otherwise the mock)
+
+    Session-scoped and autouse: the stub is guaranteed present once per
+    worker session, and per-test wiring goes through mock.patch of
+    xamr.core.yt.load, which keeps workers independent under xdist.
+    """
+    return sys.modules.get('yt', _YT_MOCK)
+
+
+@pytest.fixture(scope="session")
+def fake_numpy():
+    """Cached numpy module (the real one when installed, otherwise the mock)
+
+    Opt-in only: tests that import real numpy never pay for the fixture.
+    """
     return sys.modules['numpy']
@@ -0,0 +1,65 @@
+"""
+Equivalence tests for the optional JIT kernels
+
+Every kernel in xamr._numba_kernels is checked against its plain numpy
+formulation on random data. When numba is installed these exercise the
+JIT-compiled parallel branch — the rest of the suite only sees the
+kernels through uniform test data, so a parallel-transform miscompile
+(lost stores, wrong reduction) would otherwise ship silently.
+"""
+
+import numpy as np
+import pytest
+
+from xamr import _numba_kernels as kernels
+
+SHAPES = [(8,), (1000,), (5, 7), (32, 16, 8)]
+
+
+@pytest.fixture(params=SHAPES, ids=str)
+def operands(request):
+    """Three random arrays of one shape, fixed seed per shape"""
+    rng = np.random.default_rng(abs(hash(request.param)) % 2**32)
+    return tuple(rng.standard_normal(request.param) for _ in range(3))
+
+
+class TestKernelEquivalence:
+    """JIT kernels must match their numpy formulations exactly"""
+
+    def test_fused_sub(self, operands):
+        a, b, _ = operands
+        assert np.allclose(kernels._fused_sub(a, b), a - b)
+
+    def test_fused_add2(self, operands):
+        a, b, _ = operands
+        assert np.allclose(kernels._fused_add2(a, b), a + b)
+
+    def test_fused_add3(self, operands):
+        a, b, c = operands
+        assert np.allclose(kernels._fused_add3(a, b, c), a + b + c)
+
+    def test_stat3(self, operands):
+        a, _, _ = operands
+        mn, mx, mean = kernels._stat3(a)
+        assert mn == a.min()
+        assert mx == a.max()
+        assert np.isclose(mean, a.mean())
+
+    def test_central_diff(self, operands):
+        a, _, _ = operands
+        inv_dx = 2.5
+        result = kernels._central_diff(np.ascontiguousarray(a), inv_dx)
+
+        expected = np.empty_like(a)
+        expected[..., 1:-1] = (a[..., 2:] - a[..., :-2]) * (0.5 * inv_dx)
+        expected[..., 0] = (a[..., 1] - a[..., 0]) * inv_dx
+        expected[..., -1] = (a[..., -1] - a[..., -2]) * inv_dx
+        assert np.allclose(result, expected)
+
+    def test_output_shape_and_independence(self, operands):
+        """Results keep the input shape and own their memory"""
+        a, b, c = operands
+        out = kernels._fused_add3(a, b, c)
+        assert out.shape == a.shape
+        a += 1.0
+        assert np.allclose(out, (a - 1.0) + b + c)
@@ -5,47 +5,77 @@ Unit tests for xamr package
 import pytest
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
 
-# Add the parent directory to the path so we can import xamr
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import importlib
 
-from xamr.core import AMReXDataset, AMReXDataArray, AMReXCalculations
-from xamr.utils import open_amrex
+
+def _core():
+    """Deferred xamr.core import: selecting a subset with -k no longer
+    executes the heavy module chain at collection time"""
+    return importlib.import_module('xamr.core')
+
+
+def _utils():
+    """Deferred xamr.utils import (see _core)"""
+    return importlib.import_module('xamr.utils')
+
+
+# Frozen mock payloads: never mutated, so allocate them once and make any
+# accidental write fail loudly. The domain descriptors are plain tuples —
+# the code under test only indexes them, and tuples skip ndarray
+# construction entirely.
+_ZEROS64 = np.zeros(64)
+_ZEROS64.setflags(write=False)
+_DOMAIN_LEFT_EDGE = (0.0, 0.0, 0.0)
+_DOMAIN_RIGHT_EDGE = (100.0, 100.0, 100.0)
+_DOMAIN_DIMENSIONS = (64, 64, 64)
+
+
+def _build_yt_ds_mock():
+    """Build the invariant yt-dataset mock tree once; tests reset and reuse it
+
+    MagicMock construction spawns a child mock per attribute, so rebuilding
+    this tree in every setup_method dominates test setup time.
+    """
+    yt_ds = MagicMock()
+    yt_ds.dimensionality = 3
+    yt_ds.max_level = 2
+    yt_ds.current_time = 1.5
+    yt_ds.domain_left_edge = _DOMAIN_LEFT_EDGE
+    yt_ds.domain_right_edge = _DOMAIN_RIGHT_EDGE
+    yt_ds.domain_dimensions = _DOMAIN_DIMENSIONS
+    yt_ds.field_list = [('amrex', 'temperature'), ('amrex', 'density')]
+    yt_ds.parameters = {'param1': 'value1'}
+    yt_ds.covering_grid.return_value.__getitem__.return_value = _ZEROS64
+    return yt_ds
+
+
+_YT_DS_TEMPLATE = _build_yt_ds_mock()
+
+_UTILS_YT_DS_TEMPLATE = MagicMock()
+_UTILS_YT_DS_TEMPLATE.current_time = 1.5
+_UTILS_YT_DS_TEMPLATE.covering_grid.return_value.__getitem__.return_value = _ZEROS64
+
+_CALC_YT_DS_TEMPLATE = MagicMock()
+_CALC_YT_DS_TEMPLATE.derived_field_list = []
 
 
 @patch('xamr.core.yt.load')
 class TestAMReXDataset:
     """Test cases for AMReXDataset class"""
-    
+
     def setup_method(self):
-        """Set up test fixtures"""
-        # Create a mock yt dataset
-        self.mock_yt_ds = MagicMock()
-        self.mock_yt_ds.dimensionality = 3
-        self.mock_yt_ds.max_level = 2
-        self.mock_yt_ds.current_time = 1.5
-        self.mock_yt_ds.domain_left_edge = np.array([0.0, 0.0, 0.0])
-        self.mock_yt_ds.domain_right_edge = np.array([100.0, 100.0, 100.0])
-        self.mock_yt_ds.domain_dimensions = np.array([64, 64, 64])
-        self.mock_yt_ds.field_list = [('amrex', 'temperature'), ('amrex', 'density')]
-        self.mock_yt_ds.parameters = {'param1': 'value1'}
-        
-        # Mock covering_grid
-        self.mock_coarsest_grid = MagicMock()
-        self.mock_coarsest_grid.__getitem__.return_value = np.zeros(64)
-        self.mock_yt_ds.covering_grid.return_value = self.mock_coarsest_grid
-        
-        # Mock all_data method
-        self.mock_all_data = MagicMock()
-        self.mock_yt_ds.all_data.return_value = self.mock_all_data
+        """Set up test fixtures from the cached template"""
+        self.mock_yt_ds = _YT_DS_TEMPLATE
+        self.mock_yt_ds.reset_mock()
+        self.mock_coarsest_grid = self.mock_yt_ds.covering_grid.return_value
+        self.mock_all_data = self.mock_yt_ds.all_data.return_value
     
     def test_init(self, mock_yt_load):
         """Test AMReXDataset initialization"""
         mock_yt_load.return_value = self.mock_yt_ds
         
-        ds = AMReXDataset('test_file.plt')
+        ds = _core().AMReXDataset('test_file.plt')
         
         assert ds._yt_ds == self.mock_yt_ds
         assert ds._all_data[0] == self.mock_all_data
@@ -54,7 +84,7 @@ class TestAMReXDataset:
     def test_build_coordinates(self, mock_yt_load):
         """Test coordinate building"""
         mock_yt_load.return_value = self.mock_yt_ds
-        ds = AMReXDataset('test_file.plt')
+        ds = _core().AMReXDataset('test_file.plt')
         
         # Check dims
         assert ds.dims == ['z', 'y', 'x']
@@ -73,7 +103,7 @@ class TestAMReXDataset:
     def test_build_data_vars(self, mock_yt_load):
         """Test data variable building"""
         mock_yt_load.return_value = self.mock_yt_ds
-        ds = AMReXDataset('test_file.plt')
+        ds = _core().AMReXDataset('test_file.plt')
         
         # Check AMReX fields
         assert 'temperature' in ds.data_vars
@@ -88,7 +118,7 @@ class TestAMReXDataset:
     def test_attrs_property(self, mock_yt_load):
         """Test attrs property"""
         mock_yt_load.return_value = self.mock_yt_ds
-        ds = AMReXDataset('test_file.plt')
+        ds = _core().AMReXDataset('test_file.plt')
         attrs = ds.attrs
         
         assert attrs['max_level'] == 2
@@ -99,17 +129,17 @@ class TestAMReXDataset:
     def test_levels_property(self, mock_yt_load):
         """Test levels property"""
         mock_yt_load.return_value = self.mock_yt_ds
-        ds = AMReXDataset('test_file.plt')
+        ds = _core().AMReXDataset('test_file.plt')
         assert ds.levels == [0, 1, 2]
     
     def test_getitem(self, mock_yt_load):
         """Test field access via __getitem__"""
         mock_yt_load.return_value = self.mock_yt_ds
-        ds = AMReXDataset('test_file.plt')
+        ds = _core().AMReXDataset('test_file.plt')
         
         # Test valid field
         temp = ds['temperature']
-        assert isinstance(temp, AMReXDataArray)
+        assert isinstance(temp, _core().AMReXDataArray)
         assert temp.field_name == 'temperature'
         
         # Test invalid field
@@ -119,10 +149,10 @@ class TestAMReXDataset:
     def test_calc_property(self, mock_yt_load):
         """Test calc property"""
         mock_yt_load.return_value = self.mock_yt_ds
-        ds = AMReXDataset('test_file.plt')
+        ds = _core().AMReXDataset('test_file.plt')
         calc = ds.calc
         
-        assert isinstance(calc, AMReXCalculations)
+        assert isinstance(calc, _core().AMReXCalculations)
         assert calc.ds == ds
 
 
@@ -136,6 +166,9 @@ class TestAMReXDataArray:
         self.mock_ds.data_vars = {'temperature': ('amrex', 'temperature')}
         self.mock_ds._yt_ds = Mock()
         self.mock_ds._yt_ds.dimensionality = 3
+        self.mock_ds._ndim = 3
+        self.mock_ds._max_level = 2
+        self.mock_ds._selection_field_cache = {}
         self.mock_ds._times = [1.5]
         self.mock_ds.dims = ['z', 'y', 'x']
         self.mock_ds.coords = {
@@ -143,37 +176,37 @@ class TestAMReXDataArray:
             'y_range': (0.0, 100.0),
             'z_range': (0.0, 100.0)
         }
+        self.mock_ds._dim_ranges = (('x', 0.0, 100.0, 1.0),
+                                    ('y', 0.0, 100.0, 1.0),
+                                    ('z', 0.0, 100.0, 1.0))
         
         # Mock selection object
         self.mock_selection = Mock()
         self.mock_selection.__getitem__ = Mock()
         
-        # Mock data
+        # Mock data; statistical return values are wired per parametrized case
         self.mock_data = Mock()
-        self.mock_data.max.return_value = 300.0
-        self.mock_data.min.return_value = 200.0
-        self.mock_data.mean.return_value = 250.0
         self.mock_selection.__getitem__.return_value = self.mock_data
     
     def test_init(self):
         """Test AMReXDataArray initialization"""
-        arr = AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
+        arr = _core().AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
         
         assert arr.parent == self.mock_ds
         assert arr.field_name == 'temperature'
         assert arr._field_tuple == ('amrex', 'temperature')
         assert arr._selection_obj == self.mock_selection
-        assert arr._data is None
-    
+        assert arr._data is None  # nothing loaded yet
+
     def test_data_property(self):
         """Test lazy data loading"""
-        arr = AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
-        
-        # First access should load data
+        arr = _core().AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
+
+        # First access should load data and cache it on the instance
         data = arr.data
         assert data == self.mock_data
         assert arr._data == self.mock_data
-        
+
         # Second access should return cached data
         data2 = arr.data
         assert data2 == self.mock_data
@@ -181,16 +214,20 @@ class TestAMReXDataArray:
     
     def test_dims_property(self):
         """Test dims property"""
-        arr = AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
+        arr = _core().AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
         assert arr.dims == ['z', 'y', 'x']
     
-    def test_statistical_methods(self):
-        """Test statistical methods"""
-        arr = AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
-        
-        assert arr.max() == 300.0
-        assert arr.min() == 200.0
-        assert arr.mean() == 250.0
+    @pytest.mark.parametrize("method,expected", [
+        ("max", 300.0),
+        ("min", 200.0),
+        ("mean", 250.0),
+    ])
+    def test_statistical_methods(self, method, expected):
+        """Test statistical methods (reductions run over the raw buffer)"""
+        self.mock_selection.__getitem__.return_value = np.array([200.0, 250.0, 300.0])
+        arr = _core().AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
+
+        assert getattr(arr, method)() == expected
     
     def test_spatial_select(self):
         """Test spatial selection"""
@@ -199,28 +236,27 @@ class TestAMReXDataArray:
         mock_region = Mock()
         self.mock_ds._yt_ds.region.return_value = mock_region
         
-        arr = AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
+        arr = _core().AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
         
         # Test slice selection
         result = arr.spatial_select(x=slice(10, 20), y=slice(30, 40))
         
-        assert isinstance(result, AMReXDataArray)
+        assert isinstance(result, _core().AMReXDataArray)
         assert result.field_name == 'temperature'
         self.mock_ds._yt_ds.region.assert_called_once()
     
     def test_sel_method(self):
         """Test sel method (alias for spatial_select)"""
-        arr = AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
-        
-        # Mock spatial_select
-        arr.spatial_select = Mock()
+        arr = _core().AMReXDataArray(self.mock_ds, 'temperature', self.mock_selection)
+
+        # Patch on the class: __slots__ instances reject new attributes
         mock_result = Mock()
-        arr.spatial_select.return_value = mock_result
-        
-        result = arr.sel(x=slice(10, 20))
-        
+        with patch.object(_core().AMReXDataArray, 'spatial_select') as mock_select:
+            mock_select.return_value = mock_result
+            result = arr.sel(x=slice(10, 20))
+
         assert result == mock_result
-        arr.spatial_select.assert_called_once_with(x=slice(10, 20))
+        mock_select.assert_called_once_with(x=slice(10, 20))
 
 
 class TestAMReXCalculations:
@@ -235,11 +271,11 @@ class TestAMReXCalculations:
             'x_velocity': ('amrex', 'x_velocity'),
             'y_velocity': ('amrex', 'y_velocity')
         }
-        self.mock_yt_ds = MagicMock()
-        self.mock_yt_ds.derived_field_list = []
+        self.mock_yt_ds = _CALC_YT_DS_TEMPLATE
+        self.mock_yt_ds.reset_mock()
         self.mock_ds._yt_datasets = [self.mock_yt_ds]  # Mock the list of datasets
         
-        self.calc = AMReXCalculations(self.mock_ds)
+        self.calc = _core().AMReXCalculations(self.mock_ds)
     
     def test_init(self):
         """Test AMReXCalculations initialization"""
@@ -261,7 +297,7 @@ class TestAMReXCalculations:
         assert 'temperature_gradient_x' in self.mock_ds.data_vars
         
         # Check return type
-        assert isinstance(result, AMReXDataArray)
+        assert isinstance(result, _core().AMReXDataArray)
         assert result.field_name == 'temperature_gradient_x'
     
     def test_divergence(self):
@@ -280,7 +316,7 @@ class TestAMReXCalculations:
         assert 'divergence' in self.mock_ds.data_vars
         
         # Check return type
-        assert isinstance(result, AMReXDataArray)
+        assert isinstance(result, _core().AMReXDataArray)
         assert result.field_name == 'divergence'
     
     def test_vorticity(self):
@@ -298,27 +334,74 @@ class TestAMReXCalculations:
         assert 'vorticity_z' in self.mock_ds.data_vars
         
         # Check return type
-        assert isinstance(result, AMReXDataArray)
+        assert isinstance(result, _core().AMReXDataArray)
         assert result.field_name == 'vorticity_z'
 
 
+class TestDerivedFieldCallbacks:
+    """Equivalence tests for the module-level derived-field factories
+
+    The callbacks combine yt gradient fields through the JIT kernels; on
+    uniform test data every gradient is exactly zero, so these feed them
+    synthetic non-uniform unyt arrays and compare against plain numpy.
+    """
+
+    @staticmethod
+    def _gradients(n):
+        unyt = pytest.importorskip('unyt')
+        rng = np.random.default_rng(7)
+        return [unyt.unyt_array(rng.standard_normal((4, 5, 6)), '1/s')
+                for _ in range(n)]
+
+    def test_divergence_fn_two_terms(self):
+        tuples = [('boxlib', 'u_gradient_x'), ('boxlib', 'v_gradient_y')]
+        grads = self._gradients(2)
+        fn = _core()._make_divergence_fn(tuples)
+
+        result = fn(None, dict(zip(tuples, grads)))
+
+        assert np.allclose(result.ndview, grads[0].ndview + grads[1].ndview)
+        assert result.units == grads[0].units
+
+    def test_divergence_fn_three_terms(self):
+        tuples = [('boxlib', 'u_gradient_x'), ('boxlib', 'v_gradient_y'),
+                  ('boxlib', 'w_gradient_z')]
+        grads = self._gradients(3)
+        fn = _core()._make_divergence_fn(tuples)
+
+        result = fn(None, dict(zip(tuples, grads)))
+
+        expected = grads[0].ndview + grads[1].ndview + grads[2].ndview
+        assert np.allclose(result.ndview, expected)
+        assert result.units == grads[0].units
+
+    def test_vorticity_fn(self):
+        v_grad_x_tuple = ('boxlib', 'v_gradient_x')
+        u_grad_y_tuple = ('boxlib', 'u_gradient_y')
+        v_grad_x, u_grad_y = self._gradients(2)
+        fn = _core()._make_vorticity_fn(v_grad_x_tuple, u_grad_y_tuple)
+
+        result = fn(None, {v_grad_x_tuple: v_grad_x, u_grad_y_tuple: u_grad_y})
+
+        assert np.allclose(result.ndview, v_grad_x.ndview - u_grad_y.ndview)
+        assert result.units == v_grad_x.units
+
+
 @patch('xamr.core.yt.load')
 class TestUtils:
     """Test cases for utility functions"""
     
     def setup_method(self):
-        """Set up test fixtures"""
-        # Mock yt.load
-        self.mock_ds = MagicMock()
-        self.mock_ds.current_time = 1.5
-        self.mock_ds.covering_grid.return_value.__getitem__.return_value = np.zeros(64)
+        """Set up test fixtures from the cached template"""
+        self.mock_ds = _UTILS_YT_DS_TEMPLATE
+        self.mock_ds.reset_mock()
     
     def test_open_amrex(self, mock_yt_load):
         """Test open_amrex function"""
         mock_yt_load.return_value = self.mock_ds
-        ds = open_amrex('test_file.plt')
+        ds = _utils().open_amrex('test_file.plt')
         
-        assert isinstance(ds, AMReXDataset)
+        assert isinstance(ds, _core().AMReXDataset)
         mock_yt_load.assert_called_with('test_file.plt')
 
 
@@ -2,11 +2,35 @@
 xamr: xarray-like interface for AMReX data via yt
 """
 
-from .core import AMReXDataset, AMReXDataArray, AMReXCalculations
-from .utils import open_amrex
+import importlib
 
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-__all__ = ["AMReXDataset", "AMReXDataArray", "AMReXCalculations", "open_amrex"]
+__all__ = ["AMReXDataset", "AMReXDataArray", "AMReXCalculations", "open_amrex",
+           "clear_cache"]
+
+# Importing .core pulls in yt (and with it numpy, unyt, h5py, ...), which can
+# take seconds. Resolve the public names lazily (PEP 562) so import xamr is
+# cheap until a symbol is actually used.
+_LAZY = {
+    "AMReXDataset": ("xamr.core", "AMReXDataset"),
+    "AMReXDataArray": ("xamr.core", "AMReXDataArray"),
+    "AMReXCalculations": ("xamr.core", "AMReXCalculations"),
+    "open_amrex": ("xamr.utils", "open_amrex"),
+    "clear_cache": ("xamr.core", "clear_cache"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
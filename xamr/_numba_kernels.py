@@ -0,0 +1,116 @@
+"""
+Optional JIT kernels for xamr
+
+Numba is optional (install with xamr[speed]). When it is available the
+kernels below are JIT-compiled into single fused parallel loops; otherwise
+they fall back to plain NumPy ufuncs with the same signatures, so callers
+never need to check for numba themselves.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    # Compilation flags for the fused kernels: bounds checks are provably
+    # unnecessary (all arrays share one shape), error_model='numpy' drops
+    # the zero-division guards, nogil lets the I/O thread pool overlap with
+    # kernel execution, and cache=True persists the compiled machine code
+    # on disk so each (dtype, ndim) signature is compiled once per machine
+    # rather than once per process.
+    _JIT_FLAGS = dict(cache=True, fastmath=True, parallel=True,
+                      nogil=True, boundscheck=False, error_model='numpy')
+
+    # The elementwise kernels allocate a flat output and reshape on return
+    # rather than writing through an out.ravel() view: numba's parallel
+    # transform can lose stores made through the view (observed with the
+    # three-operand add — the kernel returned the uninitialized buffer),
+    # while stores into the allocated array itself are handled correctly.
+
+    @numba.njit(**_JIT_FLAGS)
+    def _fused_sub(a, b):
+        """out[i] = a[i] - b[i] in one parallel pass"""
+        af, bf = a.ravel(), b.ravel()
+        of = np.empty_like(af)
+        for i in numba.prange(af.size):
+            of[i] = af[i] - bf[i]
+        return of.reshape(a.shape)
+
+    @numba.njit(**_JIT_FLAGS)
+    def _fused_add2(a, b):
+        """out[i] = a[i] + b[i] in one parallel pass"""
+        af, bf = a.ravel(), b.ravel()
+        of = np.empty_like(af)
+        for i in numba.prange(af.size):
+            of[i] = af[i] + bf[i]
+        return of.reshape(a.shape)
+
+    @numba.njit(**_JIT_FLAGS)
+    def _fused_add3(a, b, c):
+        """out[i] = a[i] + b[i] + c[i] in one parallel pass, no temporaries"""
+        af, bf, cf = a.ravel(), b.ravel(), c.ravel()
+        of = np.empty_like(af)
+        for i in numba.prange(af.size):
+            of[i] = af[i] + bf[i] + cf[i]
+        return of.reshape(a.shape)
+
+    @numba.njit(**_JIT_FLAGS)
+    def _stat3(a):
+        """(min, max, mean) of a buffer in one parallel pass
+
+        Separate min/max/mean calls each stream the buffer through memory
+        again; fusing the three reductions into one loop reads it once.
+        """
+        af = a.ravel()
+        mn = af[0]
+        mx = af[0]
+        total = 0.0
+        for i in numba.prange(af.size):
+            v = af[i]
+            mn = min(mn, v)
+            mx = max(mx, v)
+            total += v
+        return mn, mx, total / af.size
+
+    @numba.njit(**_JIT_FLAGS)
+    def _central_diff(a, inv_dx):
+        """Central difference along the last axis, one-sided at the ends
+
+        a must be C-contiguous with at least two samples on the last axis;
+        inv_dx is the reciprocal grid spacing along that axis.
+        """
+        out = np.empty_like(a)
+        a2 = a.reshape(-1, a.shape[-1])
+        o2 = out.reshape(-1, a.shape[-1])
+        n = a2.shape[1]
+        half = 0.5 * inv_dx
+        for r in numba.prange(a2.shape[0]):
+            o2[r, 0] = (a2[r, 1] - a2[r, 0]) * inv_dx
+            for i in range(1, n - 1):
+                o2[r, i] = (a2[r, i + 1] - a2[r, i - 1]) * half
+            o2[r, n - 1] = (a2[r, n - 1] - a2[r, n - 2]) * inv_dx
+        return out
+else:
+    def _fused_sub(a, b):
+        return np.subtract(a, b)
+
+    def _fused_add2(a, b):
+        return np.add(a, b)
+
+    def _fused_add3(a, b, c):
+        out = np.add(a, b)
+        out += c
+        return out
+
+    def _stat3(a):
+        return np.min(a), np.max(a), np.mean(a)
+
+    def _central_diff(a, inv_dx):
+        out = np.empty_like(a)
+        out[..., 1:-1] = (a[..., 2:] - a[..., :-2]) * (0.5 * inv_dx)
+        out[..., 0] = (a[..., 1] - a[..., 0]) * inv_dx
+        out[..., -1] = (a[..., -1] - a[..., -2]) * inv_dx
+        return out
@@ -8,14 +8,206 @@ This package provides an xarray-like interface for AMReX data via yt, supporting
 - Spatial and temporal selection methods
 """
 
+import functools
+
 import yt
 import numpy as np
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Union, Dict, Any, Optional, List
+import atexit
+import fnmatch
 import glob
 import os
+import tempfile
+import threading
 from pathlib import Path
 
 
+# The JIT kernels live in their own module so numba stays an optional
+# import detail; each name falls back to a NumPy implementation when
+# numba is not installed.
+from ._numba_kernels import (_central_diff, _fused_add2, _fused_add3,
+                             _fused_sub, _stat3)
+
+
+# Coordinate names and yt index-field tuples, bound once instead of rebuilt
+# in every loop that touches coordinates
+_COORD_NAMES = ('x', 'y', 'z')
+_INDEX_FIELDS = {dim: ('index', dim) for dim in _COORD_NAMES}
+_GRID_LEVEL_FIELD = ('index', 'grid_level')
+
+# yt field-type prefixes that identify native AMReX fields; frozenset gives
+# hashed membership tests in the field_list scan
+_ACCEPTED_PREFIXES = frozenset({'boxlib', 'amrex'})
+
+# Bound on each dataset's (timestep, level, field) read cache
+_FIELD_READ_MAXSIZE = 64
+
+# Bound on the number of selections whose field reads a dataset retains;
+# each entry pins the selection and everything read through it
+_SELECTION_CACHE_MAXSIZE = 8
+
+
+def _as_ndarray(arr):
+    """View array data as a plain ndarray without copying
+
+    yt/unyt arrays expose their underlying buffer through .ndview; anything
+    else goes through np.asarray, which is also copy-free for ndarrays.
+    """
+    view = getattr(arr, 'ndview', None)
+    if view is not None:
+        return view
+    return np.asarray(arr)
+
+
+def _readonly_view(arr):
+    """Read-only plain-ndarray view of arr's buffer, without copying
+
+    The slice creates a fresh view object, so clearing the write flag
+    affects only the returned array, never the source.
+    """
+    view = _as_ndarray(arr)[:]
+    view.setflags(write=False)
+    return view
+
+
+# Stacked caches larger than this spill to a disk-backed memmap instead of
+# staying resident; override with the XAMR_MEMMAP_THRESHOLD_BYTES env var
+_MEMMAP_THRESHOLD = 1 << 30
+
+
+def _aligned_empty(shape, dtype, align=64):
+    """C-contiguous empty array on an align-byte boundary
+
+    numpy only guarantees modest allocation alignment; the SIMD reduction
+    loops want cache-line (64-byte, also AVX-512 vector) aligned buffers,
+    so over-allocate raw bytes and slice up to the boundary.
+    """
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % align
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def _alloc_stack(shape, dtype):
+    """Allocate a stacked cache block, spilling to a memmap when very large
+
+    Below the threshold this is an aligned in-memory buffer. Above it, the
+    block is backed by a scratch file (page-aligned by construction) so the
+    OS pages in only the slabs a query actually touches — RSS stays at
+    working-set size while random access is preserved.
+    """
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    threshold = int(os.environ.get('XAMR_MEMMAP_THRESHOLD_BYTES',
+                                   _MEMMAP_THRESHOLD))
+    if nbytes < threshold:
+        return _aligned_empty(shape, dtype)
+
+    with tempfile.NamedTemporaryFile(prefix='xamr-', delete=False) as tmp:
+        path = tmp.name
+    buf = np.memmap(path, dtype=dtype, mode='w+', shape=shape)
+    try:
+        # The mapping keeps the file alive; unlinking now means the space
+        # is reclaimed as soon as the array is garbage collected
+        os.unlink(path)
+    except OSError:
+        # Platforms that refuse to unlink an open mapping clean up at exit
+        atexit.register(lambda p=path: os.path.exists(p) and os.unlink(p))
+    return buf
+
+
+def _expand_pattern(pattern: str) -> List[str]:
+    """Expand a glob pattern over plotfile names with one directory scan
+
+    Plotfile series live in a single directory, so one os.scandir pass
+    filtered through fnmatch avoids glob's per-entry path handling.
+    Patterns with magic in the directory part fall back to glob.
+    """
+    dirname, name_pattern = os.path.split(pattern)
+    if glob.has_magic(dirname):
+        return sorted(glob.glob(pattern))
+    try:
+        with os.scandir(dirname or '.') as entries:
+            names = [entry.name for entry in entries]
+    except FileNotFoundError:
+        return []
+    matches = fnmatch.filter(names, name_pattern)
+    if dirname:
+        matches = [os.path.join(dirname, name) for name in matches]
+    return sorted(matches)
+
+
+@functools.lru_cache(maxsize=128)
+def _mtime_cached_load(path: str, mtime: float):
+    """yt.load memoized on (path, mtime)
+
+    Safe because yt treats plotfiles as read-only; the mtime key drops
+    stale entries when a plotfile is rewritten in place.
+    """
+    return yt.load(path)
+
+
+def _cached_yt_load(path):
+    """Load a plotfile through the mtime-keyed cache
+
+    Re-opening the same files (the typical notebook re-run) skips the
+    header re-parse entirely. Paths that cannot be stat'ed bypass the
+    cache and go straight to yt.load.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except (OSError, TypeError):
+        return yt.load(path)
+    return _mtime_cached_load(path, mtime)
+
+
+def clear_cache():
+    """Drop memoized yt.load results
+
+    Useful when a plotfile has been replaced without its mtime changing,
+    or simply to release the cached yt datasets.
+    """
+    _mtime_cached_load.cache_clear()
+
+
+def _io_workers(n_tasks: int) -> int:
+    """Thread count for per-timestep covering grid reads
+
+    The reads are I/O bound (yt releases the GIL in its I/O layer), so a
+    small pool overlaps disk latency across timesteps. Set XAMR_IO_THREADS
+    to override; 1 disables threading.
+    """
+    env = os.environ.get('XAMR_IO_THREADS')
+    if env:
+        return max(1, int(env))
+    return max(1, min(n_tasks, os.cpu_count() or 1))
+
+
+class _LazyAllData:
+    """List-like view that materializes all_data() selections on demand
+
+    Building a yt all_data object walks every grid on every level, so only
+    the timesteps actually touched should pay for it — not the whole series
+    the first time any one of them is needed.
+    """
+
+    def __init__(self, yt_datasets):
+        self._yt_datasets = yt_datasets
+        self._cache = [None] * len(yt_datasets)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __getitem__(self, i):
+        obj = self._cache[i]
+        if obj is None:
+            obj = self._yt_datasets[i].all_data()
+            self._cache[i] = obj
+        return obj
+
+
 class AMReXDataset:
     """xarray-like interface for AMReX data via yt (native AMR)
     
@@ -38,17 +230,51 @@ class AMReXDataset:
         temp_slice = ds['temperature'][0, :, :, 50]  # time=0, all z,y, x=50
     """
     
-    def __init__(self, filename: Union[str, List[str]]):
+    def __init__(self, filename: Union[str, List[str]], num_ghost_zones: int = 0,
+                 dtype=None, gradient_fields=()):
+        # Ghost zones are only needed once derived fields (gradients etc.)
+        # come into play; the calculation methods opt in on first use, so
+        # plain indexing never pays for the extra ghost-layer reads
+        self._num_ghost_zones = num_ghost_zones
+        # Optional downcast for the stacked coarsest cache. Plotfiles are
+        # float64; dtype=np.float32 halves the cache footprint and the
+        # bandwidth of every reduction over it, at visualization precision.
+        # Default None keeps the source precision.
+        self._dtype = np.dtype(dtype) if dtype is not None else None
+        # Base fields whose yt gradient fields have been registered, so the
+        # calculation methods only pay yt's field-graph bookkeeping once
+        self._gradient_registered = set()
+        # Derived fields already registered on every timestep, so repeat
+        # calculation calls skip yt's linear derived_field_list scans
+        self._added_fields = set()
+        # Field pulls shared across data arrays: every sel/spatial_select
+        # builds a fresh wrapper, and without this each wrapper would redo
+        # the AMR traversal for a selection that was already read. Keyed by
+        # id(selection) with the selection kept in the entry so ids cannot
+        # be recycled while cached; bounded as a small LRU of selections
+        # since each entry pins everything read through it. Cleared when
+        # derived fields change.
+        self._selection_field_cache = {}
         self._setup_time_series(filename)
         self._build_coordinates()
         self._build_data_vars()
+        # Optional eager registration: gradients are normally registered on
+        # first calculation call, which drops yt's field-graph bookkeeping
+        # (and the ghost-zone switch) into the middle of the first analysis
+        # step. Naming the fields up front moves that cost to open time,
+        # where the caller already expects to wait.
+        if gradient_fields:
+            calc = self.calc
+            for field in gradient_fields:
+                for dim in self._coord_names:
+                    calc.gradient(field, dim)
     
     def _setup_time_series(self, filename: Union[str, List[str]]):
         """Setup time series data from single file or multiple files"""
         if isinstance(filename, str):
             # Check if it's a glob pattern
             if '*' in filename or '?' in filename:
-                files = sorted(glob.glob(filename))
+                files = _expand_pattern(filename)
                 if not files:
                     raise FileNotFoundError(f"No files found matching pattern: {filename}")
             else:
@@ -57,42 +283,150 @@ class AMReXDataset:
             files = filename
         
         self._files = files
-        self._yt_datasets = []
-        self._times = []
-        
-        # Load all datasets and extract times
-        for file in files:
-            yt_ds = yt.load(file)
-            self._yt_datasets.append(yt_ds)
-            self._times.append(float(yt_ds.current_time))
-        
-        # Sort by time
-        sorted_indices = np.argsort(self._times)
-        self._yt_datasets = [self._yt_datasets[i] for i in sorted_indices]
-        self._times = [self._times[i] for i in sorted_indices]
-        self._files = [self._files[i] for i in sorted_indices]
+        self._single = len(files) == 1
+
+        # Load all datasets; yt.load mostly parses plotfile headers, so for
+        # a series the loads overlap their I/O latency in the thread pool
+        # (pool.map preserves file order). The time is read inside the same
+        # worker, keeping the unit conversion next to the header parse.
+        def load_one(file):
+            yt_ds = _cached_yt_load(file)
+            return yt_ds, float(yt_ds.current_time)
+
+        self._times = np.empty(len(files), dtype=np.float64)
+        if self._single:
+            yt_ds, self._times[0] = load_one(files[0])
+            self._yt_datasets = [yt_ds]
+        else:
+            with ThreadPoolExecutor(max_workers=_io_workers(len(files))) as pool:
+                loaded = list(pool.map(load_one, files))
+            self._yt_datasets = [yt_ds for yt_ds, _ in loaded]
+            for i, (_, time) in enumerate(loaded):
+                self._times[i] = time
+
+        # Sort by time; a single file needs no sort at all, and plotfiles
+        # are usually named in time order already, so check for that and
+        # skip the permutation entirely
+        if not self._single and not np.all(np.diff(self._times) >= 0):
+            order = np.argsort(self._times, kind='stable')
+            self._times = self._times[order]
+            indices = order.tolist()
+            self._yt_datasets = [self._yt_datasets[i] for i in indices]
+            self._files = [self._files[i] for i in indices]
         
-        # Use first dataset for structure info
+        # Use first dataset for structure info; dimensionality and max_level
+        # are read on every indexing call, so pin them as plain ints here
         self._yt_ds = self._yt_datasets[0]
-        self._all_data = [ds.all_data() for ds in self._yt_datasets]
-        
+        self._ndim = self._yt_ds.dimensionality
+        self._max_level = self._yt_ds.max_level
+        # Dimensionality never changes after open, so specialize the
+        # coordinate iteration once here instead of re-slicing the module
+        # constants on every coords access and selection call
+        self._coord_names = _COORD_NAMES[:self._ndim]
+
         # Get grid dimensions at coarsest level for indexing
         self._setup_coarsest_grid()
+
+    @functools.cached_property
+    def _all_data(self):
+        """Per-timestep all_data selection objects, each built on first use
+
+        Creating these eagerly instantiated a yt hierarchy per file even
+        when the caller only ever touched coarsest-level indexing; the lazy
+        wrapper defers each timestep independently.
+        """
+        return _LazyAllData(self._yt_datasets)
     
     def _setup_coarsest_grid(self):
-        """Setup uniform grid at coarsest level for indexing"""
-        self._coarsest_grids = []
-        
-        for yt_ds in self._yt_datasets:
-            # Create covering grid at level 0 (coarsest) with ghost zones for gradient calculations
-            # Ghost zones are needed for derived fields like gradients and are generally safe to include
-            coarsest_grid = yt_ds.covering_grid(
-                level=0,
+        """Setup lazy uniform-grid cache at the coarsest level for indexing
+
+        Building a covering grid walks the AMR hierarchy, so grids are
+        created on demand per time step rather than eagerly for the whole
+        series at construction time.
+        """
+        self._level_grid_cache = {}
+        self._field_read_cache = {}
+        self._field_read_lock = threading.Lock()
+
+    def _level_grid(self, t_idx, level):
+        """Covering grid at a given level for one time step (built once, cached)
+
+        Keyed by (t_idx, level) so repeated values(level=n) calls across
+        fields reuse the same grid instead of re-walking the hierarchy.
+        """
+        key = (t_idx, level)
+        grid = self._level_grid_cache.get(key)
+        if grid is None:
+            yt_ds = self._yt_datasets[t_idx]
+            dims = yt_ds.domain_dimensions
+            if level > 0:
+                dims = dims * yt_ds.refine_by**level
+            grid = yt_ds.covering_grid(
+                level=level,
                 left_edge=yt_ds.domain_left_edge,
-                dims=yt_ds.domain_dimensions,
-                num_ghost_zones=1  # Add ghost zones for gradient calculations
+                dims=dims,
+                num_ghost_zones=self._num_ghost_zones
             )
-            self._coarsest_grids.append(coarsest_grid)
+            self._level_grid_cache[key] = grid
+        return grid
+
+    def _require_ghost_zones(self):
+        """Switch the covering grids to include a ghost layer
+
+        Called by the calculation methods before registering derived fields,
+        whose stencils need neighbouring cells. Cached grids and field reads
+        are dropped so subsequent reads come from ghost-aware grids; the
+        interior values themselves are unchanged, so data arrays that cached
+        coarsest data earlier stay valid.
+        """
+        if self._num_ghost_zones >= 1:
+            return
+        self._num_ghost_zones = 1
+        self._level_grid_cache.clear()
+        with self._field_read_lock:
+            self._field_read_cache.clear()
+
+    def _coarsest_grid(self, t_idx):
+        """Covering grid at level 0 for one time step (built once, cached)"""
+        return self._level_grid(t_idx, 0)
+
+    def _read_field_at_level(self, t_idx, level, field_tuple):
+        """Field ndarray at one (timestep, level), cached across data arrays
+
+        Different AMReXDataArray instances for the same field (or the same
+        field at the same level from different call sites) share these
+        reads. The cache is a per-instance insertion-ordered dict used as
+        an LRU — re-inserting on hit keeps hot entries at the back, and
+        the oldest entry is evicted at the bound — so cache lifetime and
+        invalidation stay tied to this dataset rather than to the class.
+
+        The I/O thread pools call this concurrently, so the pop/insert
+        sequences are serialized by a per-dataset lock; the yt read itself
+        runs outside the lock, so a lost race costs one redundant read,
+        never a corrupted dict.
+        """
+        key = (t_idx, level, field_tuple)
+        cache = self._field_read_cache
+        with self._field_read_lock:
+            arr = cache.pop(key, None)
+            if arr is not None:
+                cache[key] = arr
+                return arr
+        arr = _as_ndarray(self._level_grid(t_idx, level)[field_tuple])
+        with self._field_read_lock:
+            if key not in cache and len(cache) >= _FIELD_READ_MAXSIZE:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = arr
+        return arr
+
+    def prefetch_all(self):
+        """Eagerly build the coarsest-level grids for every time step
+
+        Useful before a loop that touches all time steps, to pay the
+        hierarchy-walk cost up front instead of on first access.
+        """
+        for t_idx in range(len(self._yt_datasets)):
+            self._coarsest_grid(t_idx)
     
     def _build_coordinates(self):
         """Build coordinate mappings for AMR structure"""
@@ -105,60 +439,95 @@ class AMReXDataset:
             self.coords['time'] = np.array(self._times)
         
         # Spatial coordinates - these will be non-uniform due to AMR
-        coord_names = ['x', 'y', 'z'][:self._yt_ds.dimensionality]
+        coord_names = self._coord_names
         self.dims.extend(coord_names[::-1])  # z, y, x for 3D (or y, x for 2D)
         
-        # Get coordinate ranges (domain bounds)
-        for dim in coord_names:
-            self.coords[f'{dim}_range'] = (
-                float(self._yt_ds.domain_left_edge[coord_names.index(dim)]),
-                float(self._yt_ds.domain_right_edge[coord_names.index(dim)])
-            )
-        
-        # Coordinate arrays at coarsest level
-        coarsest_grid = self._coarsest_grids[0]
+        # Coordinate ranges (domain bounds) and coordinate arrays at the
+        # coarsest level, in one pass with the edge arrays read only once
+        left = self._yt_ds.domain_left_edge
+        right = self._yt_ds.domain_right_edge
+        coarsest_grid = self._coarsest_grid(0)
         for i, dim in enumerate(coord_names):
-            self.coords[dim] = np.array(coarsest_grid[('index', dim)])
+            self.coords[f'{dim}_range'] = (float(left[i]), float(right[i]))
+            self.coords[dim] = _as_ndarray(coarsest_grid[_INDEX_FIELDS[dim]])
         
         # AMR level information
-        self.coords['levels'] = list(range(self._yt_ds.max_level + 1))
+        self.coords['levels'] = list(range(self._max_level + 1))
         
     def _build_data_vars(self):
         """Identify available data variables"""
-        self.data_vars = {}
-        for field in self._yt_ds.field_list:
-            if field[0] in ['boxlib', 'amrex']:  # AMReX fields
-                self.data_vars[field[1]] = field
-        
+        base_vars = {field[1]: field for field in self._yt_ds.field_list
+                     if field[0] in _ACCEPTED_PREFIXES}  # AMReX fields
+
         # Also include coordinate fields
-        for dim in ['x', 'y', 'z'][:self._yt_ds.dimensionality]:
-            if dim not in self.data_vars:
-                self.data_vars[dim] = ('index', dim)
+        for dim in self._coord_names:
+            base_vars.setdefault(dim, _INDEX_FIELDS[dim])
+
+        # The base fields are computed once from field_list and frozen;
+        # derived fields added later (gradients, vorticity, ...) land in
+        # the mutable front map of the chain
+        self.data_vars = ChainMap({}, MappingProxyType(base_vars))
 
     def __getitem__(self, field_name: str) -> 'AMReXDataArray':
         """Access fields like ds['temperature']"""
-        if field_name not in self.data_vars:
+        # One .get() instead of a membership test followed by a lookup;
+        # pass the tuple along so the array does not look it up again
+        field_tuple = self.data_vars.get(field_name)
+        if field_tuple is None:
             raise KeyError(f"Field '{field_name}' not found")
-        return AMReXDataArray(self, field_name)
+        return AMReXDataArray(self, field_name, field_tuple=field_tuple)
 
-    @property
+    @functools.cached_property
     def attrs(self):
-        """Dataset attributes"""
+        """Dataset attributes, built once on first access"""
         return {
-            'max_level': self._yt_ds.max_level,
-            'dimensionality': self._yt_ds.dimensionality,
+            'max_level': self._max_level,
+            'dimensionality': self._ndim,
             'times': self._times,
             'n_timesteps': len(self._times),
-            'domain_left_edge': self._yt_ds.domain_left_edge,
-            'domain_right_edge': self._yt_ds.domain_right_edge,
-            'domain_dimensions': self._yt_ds.domain_dimensions,
-            'parameters': dict(self._yt_ds.parameters)
+            # Zero-copy read-only views: callers get the numbers without
+            # the unit wrapper and cannot scribble on yt's domain geometry
+            'domain_left_edge': _readonly_view(self._yt_ds.domain_left_edge),
+            'domain_right_edge': _readonly_view(self._yt_ds.domain_right_edge),
+            'domain_dimensions': _readonly_view(self._yt_ds.domain_dimensions),
+            # A mappingproxy shares yt's parameters dict without the eager
+            # copy (hundreds of entries) while keeping callers from
+            # mutating yt's state through attrs
+            'parameters': MappingProxyType(self._yt_ds.parameters)
         }
     
-    @property
+    @functools.cached_property
+    def _dim_ranges(self):
+        """Per-dimension (name, lo, hi, delta) bounds, computed once
+
+        Spatial selection walked self.coords with f-string keys on every
+        call; this pins the domain bounds — and the 1% half-width used for
+        point selections — as plain floats in one flat tuple.
+        """
+        ranges = []
+        for dim in self._coord_names:
+            lo, hi = self.coords[f'{dim}_range']
+            ranges.append((dim, lo, hi, 0.01 * (hi - lo)))
+        return tuple(ranges)
+
+    @functools.cached_property
+    def _inv_cell_widths(self):
+        """Reciprocal level-0 cell widths per dimension, computed once
+
+        Spacing-dependent calculations divide by dx far more often than
+        they multiply by it; caching 1/dx turns each of those divisions
+        into a multiplication.
+        """
+        ndim = self._ndim
+        left = np.asarray(self._yt_ds.domain_left_edge, dtype=np.float64)[:ndim]
+        right = np.asarray(self._yt_ds.domain_right_edge, dtype=np.float64)[:ndim]
+        dims = np.asarray(self._yt_ds.domain_dimensions, dtype=np.float64)[:ndim]
+        return dims / (right - left)
+
+    @functools.cached_property
     def levels(self):
-        """Available AMR levels"""
-        return list(range(self._yt_ds.max_level + 1))
+        """Available AMR levels, built once on first access"""
+        return list(range(self._max_level + 1))
     
     @property
     def calc(self):
@@ -184,15 +553,30 @@ class AMReXDataArray:
         data[0, :, :]       # time=0, all z,y (for 2D)
         data[:, 10, :]      # all times, z=10, all y (for 2D)
     """
-    
-    def __init__(self, parent_ds: AMReXDataset, field_name: str, selection_obj=None):
+
+    # Data arrays are created on every ds[field] / sel / level_select call,
+    # so a fixed slot layout beats a per-instance __dict__: smaller
+    # instances and direct-offset attribute access in the hot indexing path
+    __slots__ = ('parent', 'field_name', '_field_tuple', '_selection_obj',
+                 '_coarsest_data', '_coarsest_shape', '_stats_cache',
+                 '_n_times', '_has_time', '_ndim_spatial', '_data', '_coords')
+
+    def __init__(self, parent_ds: AMReXDataset, field_name: str, selection_obj=None,
+                 field_tuple=None):
         self.parent = parent_ds
         self.field_name = field_name
-        self._field_tuple = parent_ds.data_vars[field_name]
+        self._field_tuple = field_tuple or parent_ds.data_vars[field_name]
         # For the default selection_obj, use the first all_data object for single access
         self._selection_obj = selection_obj or parent_ds._all_data[0]
-        self._data = None  # Lazy loading
         self._coarsest_data = None  # Cached coarsest level data
+        self._coarsest_shape = None
+        self._stats_cache = {}      # Memoized max/min/mean results
+        self._data = None           # Lazily loaded selection data
+        self._coords = None         # Lazily built coordinate arrays
+        # Structure facts used on every indexing call, resolved once here
+        self._n_times = len(parent_ds._times)
+        self._has_time = self._n_times > 1
+        self._ndim_spatial = parent_ds._ndim
     
     def __getitem__(self, key):
         """Index into the coarsest level data
@@ -205,97 +589,139 @@ class AMReXDataArray:
             Scalar value or numpy array depending on indexing
         """
         # Ensure we have coarsest level data loaded
-        if self._coarsest_data is None:
-            self._load_coarsest_data()
-        
+        coarsest_data = self._coarsest()
+
         # Handle different indexing patterns
         if not isinstance(key, tuple):
             key = (key,)
-        
-        # Determine if we have time dimension
-        has_time = len(self.parent._times) > 1
-        n_spatial_dims = self.parent._yt_ds.dimensionality
-        
+
+        # One bounds check, then a single ndarray indexing operation in
+        # both branches: the stacked block handles int, slice and fancy
+        # time indices uniformly, and the single-time path just forwards
+        # the spatial key into timestep 0
+        has_time = self._has_time
+        expected_dims = self._ndim_spatial + (1 if has_time else 0)
+        if len(key) > expected_dims:
+            raise IndexError(f"Too many indices. Expected at most {expected_dims}, got {len(key)}")
+
         if has_time:
-            # Time series: time index is first
-            expected_dims = 1 + n_spatial_dims  # time + spatial
-            if len(key) > expected_dims:
-                raise IndexError(f"Too many indices. Expected at most {expected_dims}, got {len(key)}")
-            
-            # Extract time index
-            time_idx = key[0] if len(key) > 0 else slice(None)
-            spatial_key = key[1:] if len(key) > 1 else ()
-            
-            # Handle time indexing
-            if isinstance(time_idx, slice):
-                # Time slice
-                time_start, time_stop, time_step = time_idx.indices(len(self._coarsest_data))
-                result_data = []
-                
-                for t in range(time_start, time_stop, time_step):
-                    if spatial_key:
-                        result_data.append(self._coarsest_data[t][spatial_key])
-                    else:
-                        result_data.append(self._coarsest_data[t])
-                
-                return np.array(result_data)
-            else:
-                # Single time index
-                if spatial_key:
-                    return self._coarsest_data[time_idx][spatial_key]
-                else:
-                    return self._coarsest_data[time_idx]
-        else:
-            # Single time step
-            if len(key) > n_spatial_dims:
-                raise IndexError(f"Too many indices. Expected at most {n_spatial_dims}, got {len(key)}")
-            
-            return self._coarsest_data[0][key]
+            return coarsest_data[key]
+        return coarsest_data[0][key]
     
-    def _load_coarsest_data(self):
-        """Load data at coarsest level for all time steps"""
-        self._coarsest_data = []
-        
-        for coarsest_grid in self.parent._coarsest_grids:
+    def _coarsest(self):
+        """Cached stacked coarsest-level data, loading it on first use"""
+        if self._coarsest_data is None:
+            self._load_coarsest_data()
+        return self._coarsest_data
+
+    def _read_coarsest(self, t_idx):
+        """Read this field from the coarsest grid of one time step
+
+        Goes through the dataset's memoized field reads, so multiple arrays
+        wrapping the same field share one read per timestep.
+        """
+        try:
+            return self.parent._read_field_at_level(t_idx, 0, self._field_tuple)
+        except KeyError:
+            # Field might be a derived field, try to access from the full dataset
             try:
-                field_data = np.array(coarsest_grid[self._field_tuple])
-                self._coarsest_data.append(field_data)
-            except KeyError:
-                # Field might be a derived field, try to access from the full dataset
-                try:
-                    # Get the corresponding yt dataset for this time step
-                    yt_ds_idx = self.parent._coarsest_grids.index(coarsest_grid)
-                    yt_ds = self.parent._yt_datasets[yt_ds_idx]
-                    
-                    # Create a fresh covering grid from the yt dataset with ghost zones
-                    fresh_grid = yt_ds.covering_grid(
-                        level=0,
-                        left_edge=yt_ds.domain_left_edge,
-                        dims=yt_ds.domain_dimensions,
-                        num_ghost_zones=1  # Add ghost zones for derived fields
-                    )
-                    field_data = np.array(fresh_grid[self._field_tuple])
-                    self._coarsest_data.append(field_data)
-                except (KeyError, ValueError) as e:
-                    raise KeyError(f"Field '{self._field_tuple}' not found in dataset. "
-                                 f"Make sure the field exists or has been properly calculated. "
-                                 f"Original error: {e}")
+                yt_ds = self.parent._yt_datasets[t_idx]
+
+                # Create a fresh covering grid from the yt dataset with ghost zones
+                fresh_grid = yt_ds.covering_grid(
+                    level=0,
+                    left_edge=yt_ds.domain_left_edge,
+                    dims=yt_ds.domain_dimensions,
+                    num_ghost_zones=1  # Add ghost zones for derived fields
+                )
+                # Keep the ghost-aware grid so the next field read on this
+                # timestep reuses it instead of rebuilding; the retry below
+                # then lands in the memoized read path
+                self.parent._level_grid_cache[(t_idx, 0)] = fresh_grid
+                return self.parent._read_field_at_level(t_idx, 0, self._field_tuple)
+            except (KeyError, ValueError) as e:
+                raise KeyError(f"Field '{self._field_tuple}' not found in dataset. "
+                             f"Make sure the field exists or has been properly calculated. "
+                             f"Original error: {e}")
+
+    def _load_coarsest_data(self):
+        """Load data at coarsest level for all time steps
+
+        Time steps live in separate plotfiles, so the reads are independent
+        and run in a thread pool when there is more than one.
+        """
+        n_times = len(self.parent._yt_datasets)
+        if n_times == 1:
+            frames = [self._read_coarsest(0)]
+        else:
+            with ThreadPoolExecutor(max_workers=_io_workers(n_times)) as pool:
+                frames = list(pool.map(self._read_coarsest, range(n_times)))
+
+        # Store as one C-contiguous (time, *spatial) block rather than a list
+        # of per-timestep arrays: indexing becomes plain ndarray indexing and
+        # whole-series reads stay on a single cache-friendly buffer. The
+        # frames are zero-copy views of the grid buffers, so copyto here is
+        # the only copy each timestep pays.
+        dtype = self.parent._dtype or frames[0].dtype
+        self._coarsest_data = _alloc_stack((n_times,) + frames[0].shape, dtype)
+        for t, frame in enumerate(frames):
+            np.copyto(self._coarsest_data[t], frame)
+        self._coarsest_shape = self._coarsest_data.shape
+
+    def _cached_field(self, field_tuple):
+        """Read a field over this array's selection via the dataset cache
+
+        Reads go through the dataset-level selection cache, so a second
+        wrapper over the same selection (ds['temp'] called twice, or the
+        same region re-selected) reuses the already-traversed result
+        instead of walking the AMR hierarchy again. The selection object is
+        kept in the entry so its id cannot be recycled while cached, which
+        is also why the cache is a small LRU over selections: each entry
+        pins its selection and every array read through it, so a loop over
+        many regions must evict instead of accumulating them forever.
+        """
+        cache = self.parent._selection_field_cache
+        key = id(self._selection_obj)
+        entry = cache.pop(key, None)
+        if entry is None or entry[0] is not self._selection_obj:
+            if len(cache) >= _SELECTION_CACHE_MAXSIZE:
+                cache.pop(next(iter(cache)))
+            entry = (self._selection_obj, {})
+        cache[key] = entry
+        fields = entry[1]
+        arr = fields.get(field_tuple)
+        if arr is None:
+            arr = self._selection_obj[field_tuple]
+            fields[field_tuple] = arr
+        return arr
 
     @property
     def data(self):
-        """Lazy load AMR data - returns yt YTArray"""
+        """Lazy load AMR data on first access - returns yt YTArray
+
+        Slot-backed rather than cached_property: __slots__ removes the
+        per-instance __dict__ that cached_property needs.
+        """
         if self._data is None:
-            self._data = self._selection_obj[self._field_tuple]
+            self._data = self._cached_field(self._field_tuple)
         return self._data
-    
+
     @property
     def coords(self):
-        """Get coordinate arrays for this data"""
-        coords = {}
-        for dim in ['x', 'y', 'z'][:self.parent._yt_ds.dimensionality]:
-            coords[dim] = self._selection_obj[('index', dim)]
-        coords['level'] = self._selection_obj[('index', 'grid_level')]
-        return coords
+        """Coordinate arrays for this data, built once on first access
+
+        One contiguous array per axis (structure-of-arrays), read through
+        the same per-selection cache as field data, so every wrapper over
+        one selection shares one set of coordinate arrays instead of
+        re-reading them per instance.
+        """
+        if self._coords is None:
+            coords = {}
+            for dim in self.parent._coord_names:
+                coords[dim] = self._cached_field(_INDEX_FIELDS[dim])
+            coords['level'] = self._cached_field(_GRID_LEVEL_FIELD)
+            self._coords = coords
+        return self._coords
     
     @property
     def dims(self):
@@ -304,73 +730,164 @@ class AMReXDataArray:
     @property
     def shape(self):
         """Shape of the data at coarsest level"""
-        if self._coarsest_data is None:
-            self._load_coarsest_data()
-        
-        if len(self.parent._times) > 1:
+        self._coarsest()
+
+        if self._has_time:
             # Time series shape
-            return (len(self._coarsest_data),) + self._coarsest_data[0].shape
+            return self._coarsest_shape
         else:
             # Single time step shape
-            return self._coarsest_data[0].shape
+            return self._coarsest_shape[1:]
     
     def level_select(self, level: Union[int, List[int]]) -> 'AMReXDataArray':
-        """Select specific AMR level(s)"""
-        if isinstance(level, int):
-            level = [level]
-        
-        # Create level-filtered data object
-        level_data = self.parent._yt_ds.r[:]  # Start with all data
-        # Filter by level - yt will handle this efficiently
-        level_selector = self.parent._yt_ds.r[:]
-        
-        # This is a simplified approach - yt has more sophisticated level selection
-        filtered_data = level_selector
-        
-        return AMReXDataArray(self.parent, self.field_name, filtered_data)
+        """Select specific AMR level(s)
+
+        The filter is pushed into yt as a cut_region on the grid-level
+        index field, so only cells on the requested level(s) are visited.
+        This applies to aggregate operations (.data, max/min/mean); the
+        coarsest-grid indexing path is unaffected by the selection.
+        """
+        levels = [level] if isinstance(level, int) else list(level)
+
+        # cut_region evaluates the condition with only `obj` in scope, so
+        # the string may not reference np; OR together plain comparisons
+        if len(levels) == 1:
+            condition = f"obj[('index', 'grid_level')] == {levels[0]}"
+        else:
+            condition = " | ".join(
+                f"(obj[('index', 'grid_level')] == {lvl})" for lvl in levels)
+
+        level_region = self.parent._all_data[0].cut_region([condition])
+
+        return AMReXDataArray(self.parent, self.field_name, level_region,
+                              field_tuple=self._field_tuple)
     
-    def spatial_select(self, **kwargs) -> 'AMReXDataArray':
-        """Select spatial region across all levels"""
-        # Build region selector
+    def _select_bounds(self, kwargs):
+        """Left/right edges for one spatial query
+
+        Runs over the dataset's precomputed (dim, lo, hi, delta) tuples, so
+        each call is a tight loop over plain floats with no coords lookups.
+        """
         left_edge = []
         right_edge = []
-        
-        coord_names = ['x', 'y', 'z'][:self.parent._yt_ds.dimensionality]
-        for dim in coord_names:
-            if dim in kwargs:
-                if isinstance(kwargs[dim], slice):
-                    left_edge.append(kwargs[dim].start or self.parent.coords[f'{dim}_range'][0])
-                    right_edge.append(kwargs[dim].stop or self.parent.coords[f'{dim}_range'][1])
-                else:
-                    # Single value - create small region around it
-                    val = kwargs[dim]
-                    delta = 0.01 * (self.parent.coords[f'{dim}_range'][1] - self.parent.coords[f'{dim}_range'][0])
-                    left_edge.append(val - delta)
-                    right_edge.append(val + delta)
+        for dim, lo, hi, delta in self.parent._dim_ranges:
+            sel = kwargs.get(dim)
+            if sel is None:
+                left_edge.append(lo)
+                right_edge.append(hi)
+            elif isinstance(sel, slice):
+                left_edge.append(lo if sel.start is None else sel.start)
+                right_edge.append(hi if sel.stop is None else sel.stop)
             else:
-                left_edge.append(self.parent.coords[f'{dim}_range'][0])
-                right_edge.append(self.parent.coords[f'{dim}_range'][1])
-        
-        # Create region data object
-        region_data = self.parent._yt_ds.region(left_edge, right_edge)
-        
+                # Single value - create small region around it
+                left_edge.append(sel - delta)
+                right_edge.append(sel + delta)
+        return left_edge, right_edge
+
+    def spatial_select(self, **kwargs) -> 'AMReXDataArray':
+        """Select spatial region across all levels"""
+        left_edge, right_edge = self._select_bounds(kwargs)
+        center = [0.5 * (lo + hi) for lo, hi in zip(left_edge, right_edge)]
+        region_data = self.parent._yt_ds.region(center, left_edge, right_edge)
+
         return AMReXDataArray(self.parent, self.field_name, region_data)
     
     def sel(self, **kwargs):
         """xarray-like selection (spatial only for AMR)"""
         return self.spatial_select(**kwargs)
+
+    def spatial_select_many(self, queries: List[Dict[str, Any]]) -> List[np.ndarray]:
+        """Answer a batch of spatial queries with one yt region read
+
+        Each spatial_select call walks the AMR index for its region; for a
+        batch of nearby queries (e.g. sampling stations) that cost repeats
+        per query. Here the union bounding box of all queries is read once
+        — values and cell coordinates — and each query is answered with a
+        local boolean mask over those arrays.
+
+        Args:
+            queries: list of dicts in spatial_select form, e.g.
+                [{'x': slice(0, 10)}, {'x': 5.0, 'y': 2.0}]
+
+        Returns:
+            One 1-D ndarray of field values per query (flat cell order,
+            all levels, matching .data over the equivalent region).
+        """
+        bounds = [self._select_bounds(query) for query in queries]
+        union_left = np.min([left for left, _ in bounds], axis=0)
+        union_right = np.max([right for _, right in bounds], axis=0)
+        center = 0.5 * (union_left + union_right)
+        region = self.parent._yt_ds.region(center, union_left, union_right)
+
+        values = _as_ndarray(region[self._field_tuple])
+        coord_arrays = [_as_ndarray(region[_INDEX_FIELDS[dim]])
+                        for dim in self.parent._coord_names]
+
+        results = []
+        for left, right in bounds:
+            mask = np.ones(values.shape, dtype=bool)
+            for axis, coord in enumerate(coord_arrays):
+                mask &= (coord >= left[axis]) & (coord <= right[axis])
+            results.append(values[mask])
+        return results
     
-    def max(self, **kwargs):
-        """Maximum across AMR structure"""
-        return float(self.data.max())
-    
-    def min(self, **kwargs):
-        """Minimum across AMR structure"""
-        return float(self.data.min())
-    
-    def mean(self, **kwargs):
-        """Volume-weighted mean across AMR structure"""
-        return float(self.data.mean())
+    def _reduce(self, op: str, coarsest: bool) -> float:
+        """Memoized scalar reduction
+
+        The source is chosen only by the explicit coarsest flag — the two
+        sources answer different questions (see max), so residency of the
+        coarsest cache must not silently switch between them. Results are
+        cached per (op, source).
+        """
+        use_coarsest = coarsest
+        key = (op, use_coarsest)
+        if key not in self._stats_cache:
+            # The expensive part of any reduction is materializing the
+            # source (AMR traversal or coarsest stack); once it is in hand,
+            # fill in all three stats together so max() followed by min()
+            # and mean() costs one traversal instead of three
+            # Reduce over the raw buffer in both branches: going through
+            # the YTArray methods routes every comparison through unyt's
+            # unit machinery, and the scalar result here is unitless anyway.
+            # yt selections already concatenate per-grid data into one flat
+            # array; ascontiguousarray is a no-op then and a single gather
+            # for any exotic selection, so the kernel always streams one
+            # contiguous block.
+            source = (self._coarsest() if use_coarsest
+                      else np.ascontiguousarray(_as_ndarray(self.data)))
+            mn, mx, mean = _stat3(source)
+            self._stats_cache[('min', use_coarsest)] = mn
+            self._stats_cache[('max', use_coarsest)] = mx
+            self._stats_cache[('mean', use_coarsest)] = mean
+        value = self._stats_cache[key]
+        # .item() is the C-level scalar extraction for numpy scalars;
+        # the JIT kernel already hands back plain Python floats
+        return value.item() if hasattr(value, 'item') else value
+
+    def max(self, coarsest: bool = False, **kwargs):
+        """Maximum across AMR structure
+
+        The default reduces over this array's selection — all AMR levels,
+        timestep 0. With coarsest=True it reduces over the cached level-0
+        covering grids instead, which avoids walking every AMR block but
+        spans *all* timesteps of a series; the two sources answer different
+        questions and give different numbers.
+        """
+        return self._reduce('max', coarsest)
+
+    def min(self, coarsest: bool = False, **kwargs):
+        """Minimum across AMR structure (see max for the coarsest=True
+        source and its all-timesteps caveat)"""
+        return self._reduce('min', coarsest)
+
+    def mean(self, coarsest: bool = False, **kwargs):
+        """Volume-weighted mean across AMR structure
+
+        Over the uniform level-0 grid every cell has equal volume, so the
+        plain average used on the coarsest path is already volume-weighted.
+        See max for the coarsest=True source and its all-timesteps caveat.
+        """
+        return self._reduce('mean', coarsest)
     
     def values(self, level: Optional[int] = None) -> np.ndarray:
         """Get values as numpy array for a specific refinement level
@@ -389,40 +906,78 @@ class AMReXDataArray:
         if level is None:
             level = 0  # Default to coarsest level
         
-        if level < 0 or level > self.parent._yt_ds.max_level:
-            raise ValueError(f"Level {level} is out of range. Must be between 0 and {self.parent._yt_ds.max_level}")
+        if level < 0 or level > self.parent._max_level:
+            raise ValueError(f"Level {level} is out of range. Must be between 0 and {self.parent._max_level}")
         
         if level == 0:
-            # Use cached coarsest data
-            if self._coarsest_data is None:
-                self._load_coarsest_data()
-            
-            if len(self.parent._times) > 1:
-                return np.array(self._coarsest_data)
+            # Use cached coarsest data; hand out a read-only view so a
+            # caller write cannot corrupt the cache backing indexing and
+            # the memoized reductions
+            coarsest = self._coarsest()
+            if self._has_time:
+                return _readonly_view(coarsest)
             else:
-                return self._coarsest_data[0]
+                return _readonly_view(coarsest[0])
         else:
-            # Extract data at specified level for all time steps
-            result = []
-            for yt_ds in self.parent._yt_datasets:
+            # Extract data at specified level for all time steps, reusing
+            # the dataset's cached per-(timestep, level) field reads
+            def read_level(t_idx):
                 try:
-                    level_data = yt_ds.covering_grid(
-                        level=level,
-                        left_edge=yt_ds.domain_left_edge,
-                        dims=yt_ds.domain_dimensions * yt_ds.refine_by**level,
-                        num_ghost_zones=1  # Add ghost zones for derived fields
-                    )
-                    field_values = level_data[self._field_tuple]
-                    result.append(np.array(field_values))
+                    return self.parent._read_field_at_level(t_idx, level,
+                                                            self._field_tuple)
                 except KeyError as e:
                     raise KeyError(f"Field '{self._field_tuple}' not found at level {level}. "
                                  f"Make sure the field exists or has been properly calculated. "
                                  f"Original error: {e}")
-            
-            if len(self.parent._times) > 1:
-                return np.array(result)
-            else:
-                return result[0]
+
+            n_times = len(self.parent._yt_datasets)
+            if n_times == 1:
+                # Same hazard as the level-0 paths: the cached read is a
+                # zero-copy view, so writes through it would poison every
+                # later values() call
+                return _readonly_view(read_level(0))
+
+            with ThreadPoolExecutor(max_workers=_io_workers(n_times)) as pool:
+                result = list(pool.map(read_level, range(n_times)))
+            return np.array(result)
+
+
+def _make_divergence_fn(grad_tuples):
+    """Build a yt derived-field callback summing the given gradient fields
+
+    Module-level factory so the callback closes over nothing but the field
+    tuples — no method frame, no dataset reference — and the same function
+    object is shared by every timestep it is registered on.
+    """
+    def _divergence_function(field, data):
+        # Read each gradient once and merge them in a single fused pass
+        # rather than chaining binary adds that allocate a temporary each
+        first = data[grad_tuples[0]]
+        terms = [np.ascontiguousarray(first.ndview)]
+        terms += [np.ascontiguousarray(data[t].ndview) for t in grad_tuples[1:]]
+        if len(terms) == 3:
+            div = _fused_add3(terms[0], terms[1], terms[2])
+        else:
+            div = _fused_add2(terms[0], terms[1])
+        return type(first)(div, first.units)
+    return _divergence_function
+
+
+def _make_vorticity_fn(v_grad_x_tuple, u_grad_y_tuple):
+    """Build a yt derived-field callback for dv/dx - du/dy
+
+    Same shape as _make_divergence_fn: the callback captures only the two
+    gradient field tuples.
+    """
+    def _vorticity_function(field, data):
+        v_grad_x = data[v_grad_x_tuple]
+        u_grad_y = data[u_grad_y_tuple]
+        # Combine the yt gradient fields through the fused kernel; units
+        # ride along by rewrapping the raw buffer
+        curl = _fused_sub(np.ascontiguousarray(v_grad_x.ndview),
+                          np.ascontiguousarray(u_grad_y.ndview))
+        return type(v_grad_x)(curl, v_grad_x.units)
+    return _vorticity_function
 
 
 class AMReXCalculations:
@@ -432,28 +987,87 @@ class AMReXCalculations:
         self.ds = dataset
 
     def _add_derived_field_to_all_timesteps(self, field_name_tuple, function, **kwargs):
-        """Helper to add a derived field to all yt datasets in a time series."""
+        """Helper to add a derived field to all yt datasets in a time series.
+
+        derived_field_list is a flat list with thousands of entries, so the
+        membership test below is a linear scan per timestep; the dataset's
+        seen-set short-circuits repeat registrations in O(1) before any of
+        those scans run.
+        """
+        if field_name_tuple in self.ds._added_fields:
+            return
         for yt_ds in self.ds._yt_datasets:
             if field_name_tuple not in yt_ds.derived_field_list:
                 yt_ds.add_field(field_name_tuple, function=function, **kwargs)
+        self.ds._added_fields.add(field_name_tuple)
+        # New fields can change what a cached selection read would return
+        # (yt re-resolves dependent fields), so drop the shared field cache
+        self.ds._selection_field_cache.clear()
+
+    def _ensure_gradient(self, field_tuple):
+        """Register yt gradient fields for a base field once per dataset
+
+        add_gradient_fields re-registers three fields and redoes yt's
+        field-graph bookkeeping every call, so repeat invocations for the
+        same base field are skipped via a seen-set on the dataset.
+        """
+        if field_tuple in self.ds._gradient_registered:
+            return
+        for yt_ds in self.ds._yt_datasets:
+            yt_ds.add_gradient_fields(field_tuple)
+        self.ds._gradient_registered.add(field_tuple)
+
+    def reduce(self, field: str, op: str, level: int = 0) -> float:
+        """Reduce a field with a NumPy function over one covering-grid level
+
+        Applies getattr(np, op) — e.g. 'max', 'min', 'mean', 'sum' — to the
+        cached ndarray for the requested level, skipping the YTArray and
+        unit round-trip that the selection-based reductions pay.
+        """
+        return getattr(np, op)(self.ds[field].values(level=level)).item()
+
+    def gradient_values(self, field: str, dim: str) -> np.ndarray:
+        """Gradient over the level-0 grid as a plain ndarray (fast path)
+
+        For single-level data (max_level == 0) the covering-grid cache
+        already holds the full-resolution field, so the gradient reduces
+        to a central difference over a uniform grid — one fused kernel
+        pass, no yt field registration, no ghost-zone reads. AMR datasets
+        must use gradient(), whose yt stencils are level-aware.
+        """
+        if dim not in _COORD_NAMES:
+            raise ValueError(f"Invalid dimension: {dim}")
+        if self.ds._max_level > 0:
+            raise ValueError("gradient_values requires single-level data "
+                             "(max_level == 0); use gradient() for AMR datasets")
+
+        axis = _COORD_NAMES.index(dim)
+        values = self.ds[field].values()
+        # Time series prepend a time axis to the (x, y, z) value block
+        spatial_axis = axis + (values.ndim - self.ds._ndim)
+        inv_dx = float(self.ds._inv_cell_widths[axis])
+
+        # The kernel differentiates along the last axis of a contiguous
+        # block; move the target axis there and back
+        moved = np.ascontiguousarray(np.moveaxis(values, spatial_axis, -1))
+        grad = _central_diff(moved, inv_dx)
+        return np.moveaxis(grad, -1, spatial_axis)
 
     def gradient(self, field: str, dim: str) -> AMReXDataArray:
         """Calculate gradient across all AMR levels using yt"""
-        if dim not in ['x', 'y', 'z']:
+        if dim not in _COORD_NAMES:
             raise ValueError(f"Invalid dimension: {dim}")
         
+        self.ds._require_ghost_zones()
         field_tuple = self.ds.data_vars[field]
         grad_field_name = f"{field}_gradient_{dim}"
         grad_field_tuple = (field_tuple[0], grad_field_name)
         
-        # Add gradient fields to all timesteps
-        for yt_ds in self.ds._yt_datasets:
-            # yt's add_gradient_fields creates multiple gradient fields at once
-            yt_ds.add_gradient_fields(field_tuple)
+        # yt's add_gradient_fields creates multiple gradient fields at once
+        self._ensure_gradient(field_tuple)
         
         # Add to data_vars if not already there
-        if grad_field_name not in self.ds.data_vars:
-            self.ds.data_vars[grad_field_name] = grad_field_tuple
+        self.ds.data_vars.setdefault(grad_field_name, grad_field_tuple)
         
         return AMReXDataArray(self.ds, grad_field_name)
     
@@ -462,38 +1076,30 @@ class AMReXCalculations:
         div_field_name = "divergence"
         div_field_tuple = ("boxlib", div_field_name)
 
+        self.ds._require_ghost_zones()
         u_field_tuple = self.ds.data_vars[u_field]
         v_field_tuple = self.ds.data_vars[v_field]
         
         # Ensure gradient fields exist for all timesteps
-        for yt_ds in self.ds._yt_datasets:
-            yt_ds.add_gradient_fields(u_field_tuple)
-            yt_ds.add_gradient_fields(v_field_tuple)
-        
-        u_grad_x_tuple = (u_field_tuple[0], f"{u_field}_gradient_x")
-        v_grad_y_tuple = (v_field_tuple[0], f"{v_field}_gradient_y")
-
-        def _divergence_function(field, data):
-            div = data[u_grad_x_tuple] + data[v_grad_y_tuple]
-            
-            if w_field and self.ds._yt_ds.dimensionality == 3:
-                w_field_tuple = self.ds.data_vars[w_field]
-                for yt_ds in self.ds._yt_datasets:
-                    yt_ds.add_gradient_fields(w_field_tuple)
-                w_grad_z_tuple = (w_field_tuple[0], f"{w_field}_gradient_z")
-                div += data[w_grad_z_tuple]
-            
-            return div
-        
+        self._ensure_gradient(u_field_tuple)
+        self._ensure_gradient(v_field_tuple)
+
+        grad_tuples = [(u_field_tuple[0], f"{u_field}_gradient_x"),
+                       (v_field_tuple[0], f"{v_field}_gradient_y")]
+
+        if w_field and self.ds._yt_ds.dimensionality == 3:
+            w_field_tuple = self.ds.data_vars[w_field]
+            self._ensure_gradient(w_field_tuple)
+            grad_tuples.append((w_field_tuple[0], f"{w_field}_gradient_z"))
+
         self._add_derived_field_to_all_timesteps(
             div_field_tuple,
-            function=_divergence_function,
+            function=_make_divergence_fn(grad_tuples),
             sampling_type="cell",
             units="auto"
         )
         
-        if div_field_name not in self.ds.data_vars:
-            self.ds.data_vars[div_field_name] = div_field_tuple
+        self.ds.data_vars.setdefault(div_field_name, div_field_tuple)
         
         return AMReXDataArray(self.ds, div_field_name)
     
@@ -501,29 +1107,25 @@ class AMReXCalculations:
         """Calculate vertical vorticity across all AMR levels"""
         vort_field_name = "vorticity_z"
         vort_field_tuple = ("boxlib", vort_field_name)
-        
+
+        self.ds._require_ghost_zones()
         u_field_tuple = self.ds.data_vars[u_field]
         v_field_tuple = self.ds.data_vars[v_field]
 
         # Ensure gradient fields exist for all timesteps
-        for yt_ds in self.ds._yt_datasets:
-            yt_ds.add_gradient_fields(u_field_tuple)
-            yt_ds.add_gradient_fields(v_field_tuple)
+        self._ensure_gradient(u_field_tuple)
+        self._ensure_gradient(v_field_tuple)
 
         u_grad_y_tuple = (u_field_tuple[0], f"{u_field}_gradient_y")
         v_grad_x_tuple = (v_field_tuple[0], f"{v_field}_gradient_x")
 
-        def _vorticity_function(field, data):
-            return data[v_grad_x_tuple] - data[u_grad_y_tuple]
-        
         self._add_derived_field_to_all_timesteps(
             vort_field_tuple,
-            function=_vorticity_function,
+            function=_make_vorticity_fn(v_grad_x_tuple, u_grad_y_tuple),
             sampling_type="cell",
             units="auto"
         )
         
-        if vort_field_name not in self.ds.data_vars:
-            self.ds.data_vars[vort_field_name] = vort_field_tuple
+        self.ds.data_vars.setdefault(vort_field_name, vort_field_tuple)
         
         return AMReXDataArray(self.ds, vort_field_name)